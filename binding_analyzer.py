@@ -13,26 +13,133 @@ Or as a library:
 """
 
 import subprocess
+import contextlib
 import json
-import pandas as pd
+import hashlib
+import mmap
+import shutil
 import os
+import tempfile
 import argparse
 import sys
-from collections import defaultdict
+import warnings
+from collections import Counter, defaultdict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Union
+from types import MappingProxyType
+from importlib.util import find_spec
+from operator import itemgetter
+from typing import TYPE_CHECKING, Dict, List, Mapping, Set, Tuple, Optional, Union
+
+# pandas (and pyarrow) are imported where they are used, keeping them out of
+# the import time of the toolkit
+if TYPE_CHECKING:
+    import pandas as pd
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+# Hit/miss statistics for the on-disk BINANA result cache, in the spirit of
+# functools.lru_cache().cache_info()
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+# File BINANA writes to a full output directory, but not present in cache
+# entries that hold output.json only
+_CACHE_COMPLETE_FILE = "log.txt"
+
+# File formats supported for the residue summary
+SUMMARY_FORMATS = ("csv", "parquet", "feather")
+
+
+def _import_binana(binana_path: str):
+    """
+    Import the BINANA package that sits next to run_binana.py.
+    
+    Returns:
+        The binana module, or None (with a warning) if it cannot be imported,
+        for example when run_binana.py is a wrapper with no binana package
+        beside it, or if another module named binana is imported instead, such
+        as a pip-installed BINANA or one from a different binana_path. Only one
+        can be loaded per interpreter.
+    """
+    binana_dir = Path(binana_path).resolve().parent
+    if "binana" not in sys.modules and str(binana_dir) not in sys.path:
+        sys.path.insert(0, str(binana_dir))
+    
+    try:
+        import binana
+    except ImportError as e:
+        warnings.warn(f"Could not import BINANA next to {binana_path} ({e}); "
+                      f"running it as a subprocess instead", RuntimeWarning)
+        return None
+    
+    binana_file = getattr(binana, "__file__", None)
+    if binana_file is None or Path(binana_file).resolve().parent != binana_dir / "binana":
+        warnings.warn(f"Imported module 'binana' ({binana_file}) is not the BINANA next to "
+                      f"{binana_path}; running it as a subprocess instead", RuntimeWarning)
+        return None
+    return binana
+
+
+def _load_json(path: str):
+    """
+    Load a JSON file. With orjson installed, it parses straight from a read-only
+    memory map, so the file's bytes are never copied into a Python object.
+    """
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # Empty files cannot be mapped; let orjson report the error
+                return orjson.loads(b"")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+    with open(path, 'r') as f:
+        return json.load(f)
 
 
 class BindingAnalyzer:
     """A convenient wrapper for BINANA analysis with enhanced functionality."""
     
-    def __init__(self, binana_path: Optional[str] = None, show_output: bool = True):
+    # Interaction type mappings from readable names to BINANA JSON keys, as
+    # (name, json_key) pairs in output order. Immutable, so it is shared as-is.
+    INTERACTION_KEYS: Tuple[Tuple[str, str], ...] = (
+        ("hydrogen_bonds", "hydrogenBonds"),
+        ("salt_bridges", "saltBridges"),
+        ("hydrophobic_contacts", "hydrophobicContacts"),
+        ("pi_pi_stackings", "piStackings"),
+        ("pi_cation_interactions", "piCationInteractions"),
+        ("metal_complexes", "metalComplexes"),
+        ("close_contacts", "closeContacts"),
+    )
+    
+    # Name -> JSON key lookup, kept for existing callers of this attribute. A
+    # read-only view of INTERACTION_KEYS, so it cannot drift from what is extracted.
+    interaction_keys: Mapping[str, str] = MappingProxyType(dict(INTERACTION_KEYS))
+    
+    def __init__(self, 
+                 binana_path: Optional[str] = None, 
+                 show_output: bool = True,
+                 cache_dir: Optional[str] = None,
+                 in_process: bool = True):
         """
         Initialize the BindingAnalyzer.
         
         Args:
             binana_path (str, optional): Path to run_binana.py. If None, uses relative path.
             show_output (bool): Whether to show detailed BINANA output during analysis.
+            cache_dir (str, optional): Directory for caching BINANA results by input
+                file contents. If None, BINANA is run on every call.
+            in_process (bool): Whether to import BINANA and run it in this interpreter,
+                avoiding a Python start-up per analysis. If False, run_binana.py is
+                launched as a subprocess.
         """
         if binana_path is None:
             # Use relative path from this file
@@ -42,17 +149,10 @@ class BindingAnalyzer:
             self.binana_path = binana_path
             
         self.show_output = show_output
-        
-        # Interaction type mappings from BINANA JSON keys to readable names
-        self.interaction_keys = {
-            "hydrogen_bonds": "hydrogenBonds",
-            "salt_bridges": "saltBridges", 
-            "hydrophobic_contacts": "hydrophobicContacts",
-            "pi_pi_stackings": "piStackings",
-            "pi_cation_interactions": "piCationInteractions",
-            "metal_complexes": "metalComplexes",
-            "close_contacts": "closeContacts"
-        }
+        self.cache_dir = cache_dir
+        self.in_process = in_process
+        self._cache_hits = 0
+        self._cache_misses = 0
     
     def validate_inputs(self, receptor_file: str, ligand_file: str) -> None:
         """Validate that input files exist and are readable."""
@@ -75,95 +175,473 @@ class BindingAnalyzer:
         Returns:
             bool: True if analysis succeeded, False otherwise
         """
+        try:
+            self._run_binana_or_raise(receptor_file, ligand_file, output_dir)
+            return True
+        except RuntimeError:
+            return False
+    
+    def _run_binana_or_raise(self, receptor_file: str, ligand_file: str, output_dir: str) -> None:
+        """
+        Execute BINANA analysis like run_binana(), raising RuntimeError, chained
+        to the original error, if BINANA fails.
+        """
         # Create output directory
         os.makedirs(output_dir, exist_ok=True)
         
-        # Prepare command
-        command = [
-            "python3", self.binana_path,
+        # Prepare arguments
+        args = [
             "-receptor", receptor_file,
             "-ligand", ligand_file,
             "-output_dir", output_dir,
         ]
+        command = ["python3", self.binana_path] + args
+        binana = self._in_process_binana()
         
-        if self.show_output:
-            print(f"Running BINANA analysis...")
-            print(f"Command: {' '.join(command)}")
-            print("=" * 60)
-        
+        with self._announce_binana_run(command if binana is None else None):
+            if binana is not None:
+                self._call_binana_in_process(binana.run, args)
+            else:
+                self._run_binana_subprocess(command)
+    
+    def _run_binana_subprocess(self, command: List[str]) -> None:
+        """Launch run_binana.py, raising RuntimeError, chained to the CalledProcessError, if it fails."""
         try:
             if self.show_output:
                 # Show output in real-time
-                result = subprocess.run(command, check=True)
+                subprocess.run(command, check=True)
             else:
-                # Run silently
-                result = subprocess.run(command, check=True, capture_output=True, text=True)
-            
-            if self.show_output:
-                print("=" * 60)
-                print("✅ BINANA analysis completed successfully!")
-            
-            return True
-            
+                # Run silently; stdout is discarded and only stderr is kept for diagnostics
+                subprocess.run(command, check=True, stdout=subprocess.DEVNULL, 
+                               stderr=subprocess.PIPE, text=True)
         except subprocess.CalledProcessError as e:
             print(f"❌ BINANA analysis failed: {e}")
             if hasattr(e, 'stderr') and e.stderr:
                 print(f"Error details: {e.stderr}")
-            return False
+            raise RuntimeError("BINANA analysis failed") from e
+    
+    @contextlib.contextmanager
+    def _announce_binana_run(self, command: Optional[List[str]] = None):
+        """Print the banners around a BINANA run if show_output; the closing one only on success."""
+        if self.show_output:
+            print(f"Running BINANA analysis...")
+            if command is not None:
+                print(f"Command: {' '.join(command)}")
+            print("=" * 60)
+        
+        yield
+        
+        if self.show_output:
+            print("=" * 60)
+            print("✅ BINANA analysis completed successfully!")
+    
+    def _in_process_binana(self):
+        """The BINANA package to run in this interpreter, or None to launch run_binana.py."""
+        if not self.in_process:
+            return None
+        return _import_binana(self.binana_path)
     
-    def parse_binana_output(self, output_dir: str) -> Tuple[pd.DataFrame, Dict]:
+    def _call_binana_in_process(self, function, *args):
+        """
+        Call a BINANA function in the current interpreter, silencing its output
+        unless show_output, and raising RuntimeError, chained to BINANA's own
+        error, if it fails.
+        """
+        try:
+            if self.show_output:
+                return function(*args)
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                return function(*args)
+        except Exception as e:
+            # Raised by BINANA itself
+            print(f"❌ BINANA analysis failed: {e}")
+            raise RuntimeError("BINANA analysis failed") from e
+    
+    def _binana_data_in_process(self, binana, receptor_file: str, ligand_file: str) -> Dict:
+        """
+        Run BINANA in the current interpreter and return its output as a dict,
+        with the contents of output.json but without writing any files.
+        """
+        parameters = binana._cli_params._get_params.CommandLineParameters(
+            ["-receptor", receptor_file, "-ligand", ligand_file]
+        )
+        
+        with self._announce_binana_run():
+            return self._call_binana_in_process(binana._start._get_all_interactions_dict, parameters)
+    
+    def _cache_key(self, receptor_file: str, ligand_file: str) -> str:
+        """Hash the receptor, ligand and BINANA version into a cache key."""
+        digest = hashlib.blake2b()
+        with open(receptor_file, 'rb') as f:
+            digest.update(f.read())
+        digest.update(b"|")
+        with open(ligand_file, 'rb') as f:
+            digest.update(f.read())
+        digest.update(b"|")
+        digest.update(str(os.path.getmtime(self.binana_path)).encode())
+        
+        # The binana package next to run_binana.py is the code that actually
+        # runs, so editing or upgrading any of its modules invalidates the cache
+        binana_package = Path(self.binana_path).resolve().parent / "binana"
+        for module_path in sorted(binana_package.rglob("*.py")):
+            stat = module_path.stat()
+            module_name = module_path.relative_to(binana_package)
+            digest.update(f"|{module_name}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+        return digest.hexdigest()
+    
+    def _cache_paths(self, receptor_file: str, ligand_file: str) -> Tuple[str, str]:
+        """Cache entry directory for these inputs and the output.json path inside it."""
+        cache_entry = os.path.join(self.cache_dir, self._cache_key(receptor_file, ligand_file))
+        return cache_entry, os.path.join(cache_entry, 'output.json')
+    
+    def _run_or_load_cached(self, receptor_file: str, ligand_file: str, output_dir: str) -> None:
+        """
+        Make BINANA's output files available in output_dir, restoring a cached
+        copy of the whole set from cache_dir when the same inputs have been
+        analyzed before.
+        
+        On a cache hit, the paths recorded in log.txt and output.pdb name the
+        output_dir of the run that filled the cache.
+        """
+        if self.cache_dir is None:
+            self._run_binana_or_raise(receptor_file, ligand_file, output_dir)
+            return
+        
+        cache_entry, _ = self._cache_paths(receptor_file, ligand_file)
+        
+        # Entries filled by _run_or_load_cached_data() only hold output.json
+        if os.path.exists(os.path.join(cache_entry, _CACHE_COMPLETE_FILE)):
+            self._cache_hits += 1
+            if self.show_output:
+                print(f"♻️  Using cached BINANA results: {cache_entry}")
+            shutil.copytree(cache_entry, output_dir, dirs_exist_ok=True)
+            return
+        
+        self._cache_misses += 1
+        file_mtimes = self._file_mtimes(output_dir)
+        self._run_binana_or_raise(receptor_file, ligand_file, output_dir)
+        
+        # Cache just the files this run wrote, leaving anything else in output_dir out
+        written_files = [
+            name for name, mtime in self._file_mtimes(output_dir).items()
+            if file_mtimes.get(name) != mtime
+        ]
+        self._store_cache_entry(output_dir, written_files, cache_entry)
+    
+    @staticmethod
+    def _file_mtimes(directory: str) -> Dict[str, int]:
+        """Modification times of the files in directory, by name (empty if it does not exist)."""
+        if not os.path.isdir(directory):
+            return {}
+        return {entry.name: entry.stat().st_mtime_ns for entry in os.scandir(directory) if entry.is_file()}
+    
+    def _store_cache_entry(self, source_dir: str, file_names: List[str], cache_entry: str) -> None:
+        """Copy the named files from source_dir into a new cache entry."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_entry = tempfile.mkdtemp(prefix=".tmp_", dir=self.cache_dir)
+        try:
+            for name in file_names:
+                shutil.copyfile(os.path.join(source_dir, name), os.path.join(tmp_entry, name))
+            
+            # A rename never exposes a partial entry to concurrent runs
+            try:
+                os.rename(tmp_entry, cache_entry)
+                return
+            except OSError:
+                # The entry exists (another run, or an output.json-only entry);
+                # replace its files one by one, the completeness marker last
+                pass
+            for name in sorted(os.listdir(tmp_entry), key=lambda name: name == _CACHE_COMPLETE_FILE):
+                os.replace(os.path.join(tmp_entry, name), os.path.join(cache_entry, name))
+        finally:
+            shutil.rmtree(tmp_entry, ignore_errors=True)
+    
+    def _run_or_load_cached_data(self, binana, receptor_file: str, ligand_file: str) -> Dict:
+        """
+        Like _run_or_load_cached(), but hand back BINANA's output as a dict
+        computed in-process, so nothing is written outside cache_dir.
+        """
+        if self.cache_dir is None:
+            return self._binana_data_in_process(binana, receptor_file, ligand_file)
+        
+        cache_entry, cached_json_path = self._cache_paths(receptor_file, ligand_file)
+        
+        if os.path.exists(cached_json_path):
+            self._cache_hits += 1
+            if self.show_output:
+                print(f"♻️  Using cached BINANA results: {cache_entry}")
+            return _load_json(cached_json_path)
+        
+        self._cache_misses += 1
+        binana_data = self._binana_data_in_process(binana, receptor_file, ligand_file)
+        
+        # Write via a temporary file so concurrent runs never see a partial entry
+        os.makedirs(cache_entry, exist_ok=True)
+        tmp_path = f"{cached_json_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            # Same layout as the output.json BINANA writes itself
+            json.dump(binana_data, f, indent=2, sort_keys=True, separators=(",", ": "))
+        os.replace(tmp_path, cached_json_path)
+        
+        return binana_data
+    
+    @contextlib.contextmanager
+    def _receptor_atoms_for(self, 
+                            receptor_file: str, 
+                            ligand_file: str, 
+                            output_dir: str, 
+                            materialize_outputs: bool,
+                            keep_full_data: bool,
+                            interactions: Tuple[Tuple[str, str], ...]):
+        """
+        Run BINANA (or reuse cached results) and yield its receptor atoms as
+        _load_receptor_atoms() does.
+        
+        With materialize_outputs False, nothing is written to output_dir: BINANA's
+        output is kept in memory when running in-process, or written to a
+        temporary directory that is removed on exit when running as a subprocess.
+        """
+        if materialize_outputs:
+            self._run_or_load_cached(receptor_file, ligand_file, output_dir)
+            yield self._load_receptor_atoms(output_dir, keep_full_data, interactions)
+            return
+        
+        binana = self._in_process_binana()
+        # Copies of BINANA without _get_all_interactions_dict() can only write files
+        if binana is not None and hasattr(binana._start, "_get_all_interactions_dict"):
+            binana_data = self._run_or_load_cached_data(binana, receptor_file, ligand_file)
+            receptor_atoms = self._iter_receptor_atoms(binana_data, interactions)
+            yield receptor_atoms, binana_data if keep_full_data else None
+        else:
+            with tempfile.TemporaryDirectory(prefix="binana_") as tmp_dir:
+                self._run_or_load_cached(receptor_file, ligand_file, tmp_dir)
+                yield self._load_receptor_atoms(tmp_dir, keep_full_data, interactions)
+    
+    def _cache_entries(self) -> List[str]:
+        """List the result directories currently stored in cache_dir."""
+        if self.cache_dir is None or not os.path.isdir(self.cache_dir):
+            return []
+        # Names starting with a dot are runs still being written
+        return [
+            entry.path for entry in os.scandir(self.cache_dir)
+            if entry.is_dir() and not entry.name.startswith(".")
+            and os.path.exists(os.path.join(entry.path, 'output.json'))
+        ]
+    
+    def cache_info(self) -> CacheInfo:
+        """
+        Report cache statistics, like functools.lru_cache.
+        
+        Returns:
+            CacheInfo: Hits and misses for this analyzer, and the number of
+            entries currently stored in cache_dir (maxsize is always None).
+        """
+        return CacheInfo(self._cache_hits, self._cache_misses, None, len(self._cache_entries()))
+    
+    def cache_clear(self) -> None:
+        """Remove all cached BINANA results and reset the cache statistics."""
+        for entry in self._cache_entries():
+            shutil.rmtree(entry)
+        self._cache_hits = 0
+        self._cache_misses = 0
+    
+    @classmethod
+    def _selected_interactions(cls, only: Optional[List[str]]) -> Tuple[Tuple[str, str], ...]:
+        """(interaction_name, json_key) pairs to extract, all of them if only is None."""
+        if only is None:
+            return cls.INTERACTION_KEYS
+        
+        interaction_names = [interaction_name for interaction_name, _ in cls.INTERACTION_KEYS]
+        unknown = set(only) - set(interaction_names)
+        if unknown:
+            raise ValueError(f"Unknown interaction types: {sorted(unknown)} "
+                             f"(expected some of {interaction_names})")
+        
+        return tuple(
+            (interaction_name, json_key) 
+            for interaction_name, json_key in cls.INTERACTION_KEYS
+            if interaction_name in only
+        )
+    
+    def _iter_receptor_atoms(self, binana_data: Dict, interactions: Tuple[Tuple[str, str], ...]):
+        """Yield (interaction_name, atom) pairs from parsed BINANA output."""
+        for interaction_name, json_key in interactions:
+            for entry in binana_data.get(json_key, []):
+                for atom in entry.get("receptorAtoms", []):
+                    yield interaction_name, atom
+    
+    def _stream_receptor_atoms(self, output_json_path: str, interactions: Tuple[Tuple[str, str], ...]):
+        """
+        Yield (interaction_name, atom) pairs by streaming output.json with ijson,
+        without ever holding the whole document in memory.
+        """
+        if len(interactions) == 1:
+            # A single prefix lets ijson skip everything else in its own backend
+            interaction_name, json_key = interactions[0]
+            with open(output_json_path, 'rb') as f:
+                for atom in ijson.items(f, f"{json_key}.item.receptorAtoms.item"):
+                    yield interaction_name, atom
+            return
+        
+        atom_prefixes = {
+            f"{json_key}.item.receptorAtoms.item": interaction_name
+            for interaction_name, json_key in interactions
+        }
+        
+        atom = None
+        with open(output_json_path, 'rb') as f:
+            for prefix, event, value in ijson.parse(f):
+                if event == 'start_map' and prefix in atom_prefixes:
+                    atom = {}
+                elif event == 'end_map' and prefix in atom_prefixes:
+                    yield atom_prefixes[prefix], atom
+                    atom = None
+                elif atom is not None and event in ('string', 'number'):
+                    parent, _, field = prefix.rpartition('.')
+                    if parent in atom_prefixes:
+                        atom[field] = value
+    
+    def parse_binana_output(self, 
+                            output_dir: str, 
+                            keep_full_data: bool = True,
+                            only: Optional[List[str]] = None) -> Tuple["pd.DataFrame", Optional[Dict]]:
         """
         Parse BINANA JSON output and extract interaction information.
         
         Args:
             output_dir (str): Directory containing BINANA output files
+            keep_full_data (bool): Whether to load and return the full BINANA data.
+                If False and ijson is installed, output.json is streamed instead,
+                keeping memory use independent of the file size.
+            only (List[str], optional): Interaction types to extract (names from
+                INTERACTION_KEYS). If None, extracts all of them.
             
         Returns:
-            Tuple[pd.DataFrame, Dict]: Residue interaction summary and full data
+            Tuple[pd.DataFrame, Optional[Dict]]: Residue interaction summary and
+            full data (None if keep_full_data is False)
+        """
+        interactions = self._selected_interactions(only)
+        receptor_atoms, binana_data = self._load_receptor_atoms(output_dir, keep_full_data, interactions)
+        receptor_residue_summary = self._build_residue_summary(receptor_atoms, interactions)
+        
+        return self._summary_to_df(receptor_residue_summary), binana_data
+    
+    def _load_receptor_atoms(self, 
+                             output_dir: str, 
+                             keep_full_data: bool, 
+                             interactions: Tuple[Tuple[str, str], ...]):
+        """
+        Open BINANA's output.json for reading receptor atoms.
+        
+        Returns:
+            Tuple: Iterator of (interaction_name, atom) pairs and the full BINANA
+            data (None if keep_full_data is False)
         """
         output_json_path = os.path.join(output_dir, 'output.json')
         
         if not os.path.exists(output_json_path):
             raise FileNotFoundError(f"BINANA output file not found: {output_json_path}")
         
-        # Load BINANA results
-        with open(output_json_path, 'r') as f:
-            binana_data = json.load(f)
+        if keep_full_data or ijson is None:
+            binana_data = _load_json(output_json_path)
+            receptor_atoms = self._iter_receptor_atoms(binana_data, interactions)
+            return receptor_atoms, binana_data if keep_full_data else None
         
-        # Extract receptor residue interactions
-        receptor_residue_summary = defaultdict(set)
+        return self._stream_receptor_atoms(output_json_path, interactions), None
+    
+    @staticmethod
+    def _build_residue_summary(receptor_atoms, interactions: Tuple[Tuple[str, str], ...]) -> Dict[str, Set[str]]:
+        """
+        Collect the unique chain:resNameresID labels of each interaction type.
         
-        for interaction_name, json_key in self.interaction_keys.items():
-            interactions = binana_data.get(json_key, [])
+        Uses only dicts and sets, so callers that need just the residues can skip
+        pandas entirely. Types are keyed in the order of interactions.
+        """
+        receptor_residue_summary = {interaction_name: set() for interaction_name, _ in interactions}
+        
+        # Hot loop: runs once per receptor atom, so lookups are hoisted and each
+        # residue label is formatted only on its first (resName, resID, chain)
+        get_fields = itemgetter("resName", "resID", "chain")
+        intern = sys.intern
+        labels = {}
+        current_name = add = None
+        
+        for interaction_name, atom in receptor_atoms:
+            if interaction_name != current_name:
+                current_name = interaction_name
+                add = receptor_residue_summary[interaction_name].add
             
-            for entry in interactions:
-                for atom in entry.get("receptorAtoms", []):
-                    res_name = atom.get("resName", "")
-                    res_id = atom.get("resID", "")  
-                    chain = atom.get("chain", "")
-                    
-                    if res_name and res_id:
-                        residue_str = f"{chain}:{res_name}{res_id}"
-                        receptor_residue_summary[interaction_name].add(residue_str)
-        
-        # Convert to DataFrame
-        residue_rows = []
+            try:
+                fields = get_fields(atom)
+            except KeyError:
+                fields = (atom.get("resName", ""), atom.get("resID", ""), atom.get("chain", ""))
+            
+            residue_str = labels.get(fields)
+            if residue_str is None:
+                res_name, res_id, chain = fields
+                # Interned so that batch runs share one object per residue label;
+                # "" marks atoms without a residue name or number
+                residue_str = intern(f"{chain}:{res_name}{res_id}") if res_name and res_id else ""
+                labels[fields] = residue_str
+            
+            if residue_str:
+                add(residue_str)
+        
+        return receptor_residue_summary
+    
+    @staticmethod
+    def interaction_statistics(receptor_residue_summary: Dict[str, Set[str]]) -> Tuple[Dict[str, int], int]:
+        """
+        Count residues per interaction type and overall.
+        
+        Args:
+            receptor_residue_summary (Dict[str, Set[str]]): Residues per interaction type
+            
+        Returns:
+            Tuple[Dict[str, int], int]: Residue count of each interaction type that
+            has any, most common first, and the number of unique residues
+        """
+        interaction_counts = Counter({
+            interaction_type: len(residues)
+            for interaction_type, residues in receptor_residue_summary.items()
+            if residues
+        })
+        unique_residues = len(set().union(*receptor_residue_summary.values()))
+        
+        return dict(interaction_counts.most_common()), unique_residues
+    
+    @staticmethod
+    def _summary_to_df(receptor_residue_summary: Dict[str, Set[str]]) -> "pd.DataFrame":
+        """Lay out the residue summary as a DataFrame, residues sorted within each type."""
+        import pandas as pd
+        
+        # Flatten every type into two columns and build the frame once,
+        # rather than one frame per type joined with pd.concat
+        interaction_types = []
+        receptor_residues = []
         for interaction_type, residues in receptor_residue_summary.items():
-            for res in sorted(residues):
-                residue_rows.append({
-                    "interaction_type": interaction_type,
-                    "receptor_residue": res
-                })
+            interaction_types.extend([interaction_type] * len(residues))
+            receptor_residues.extend(sorted(residues))
+        
+        residue_df = pd.DataFrame({
+            "interaction_type": interaction_types,
+            "receptor_residue": receptor_residues
+        }, dtype=str)
         
-        residue_df = pd.DataFrame(residue_rows)
+        # Residues repeat across interaction types; dictionary-encode the column
+        residue_df["receptor_residue"] = residue_df["receptor_residue"].astype("category")
         
-        return residue_df, binana_data
+        return residue_df
     
     def analyze(self, 
                 receptor_file: str, 
                 ligand_file: str, 
                 output_dir: str = "./binana_analysis/",
-                save_csv: bool = True) -> Dict:
+                save_csv: bool = True,
+                keep_full_data: bool = True,
+                output_format: str = "csv",
+                only: Optional[List[str]] = None,
+                materialize_outputs: bool = True) -> Dict:
         """
         Perform complete binding mode analysis.
         
@@ -171,38 +649,50 @@ class BindingAnalyzer:
             receptor_file (str): Path to receptor PDBQT file
             ligand_file (str): Path to ligand PDBQT file
             output_dir (str): Output directory for results
-            save_csv (bool): Whether to save CSV summary
+            save_csv (bool): Whether to save the residue summary file
+            keep_full_data (bool): Whether to include the full BINANA data in the
+                results. Pass False to save memory on large complexes.
+            output_format (str): Summary file format: 'csv', 'parquet' or 'feather'.
+                Parquet and feather require pyarrow.
+            only (List[str], optional): Interaction types to extract (names from
+                INTERACTION_KEYS). If None, extracts all of them.
+            materialize_outputs (bool): Whether to write BINANA's files and the
+                summary file to output_dir. If False, nothing is written there
+                (save_csv is ignored) and output_directory is None in the results.
             
         Returns:
             Dict: Analysis results with DataFrames and statistics
         """
         # Validate inputs
         self.validate_inputs(receptor_file, ligand_file)
+        interactions = self._selected_interactions(only)
+        save_csv = save_csv and materialize_outputs
+        if output_format not in SUMMARY_FORMATS:
+            raise ValueError(f"Unknown output format: {output_format} (expected one of {SUMMARY_FORMATS})")
+        if save_csv and output_format != "csv" and find_spec("pyarrow") is None:
+            raise ImportError(f"pyarrow is required for {output_format} output")
         
-        # Run BINANA analysis
-        if not self.run_binana(receptor_file, ligand_file, output_dir):
-            raise RuntimeError("BINANA analysis failed")
+        # Run BINANA analysis (or reuse cached results) and parse results
+        with self._receptor_atoms_for(receptor_file, ligand_file, output_dir, materialize_outputs,
+                                      keep_full_data, interactions) as (receptor_atoms, full_data):
+            receptor_residue_summary = self._build_residue_summary(receptor_atoms, interactions)
         
-        # Parse results
-        residue_df, full_data = self.parse_binana_output(output_dir)
+        interaction_stats, unique_residues = self.interaction_statistics(receptor_residue_summary)
+        residue_df = self._summary_to_df(receptor_residue_summary)
         
-        # Save CSV summary if requested
-        csv_path = None
+        # Save summary file if requested
+        summary_path = None
         if save_csv:
-            csv_path = os.path.join(output_dir, 'binding_mode_summary.csv')
-            residue_df.to_csv(csv_path, index=False)
-            
-        # Generate statistics
-        interaction_stats = residue_df['interaction_type'].value_counts().to_dict()
-        unique_residues = residue_df['receptor_residue'].nunique()
+            summary_path = self._save_summary(residue_df, output_dir, output_format)
         
         results = {
             'residue_summary': residue_df,
             'full_binana_data': full_data,
             'interaction_statistics': interaction_stats,
             'unique_residues_count': unique_residues,
-            'output_directory': output_dir,
-            'csv_file': csv_path
+            'output_directory': output_dir if materialize_outputs else None,
+            'summary_file': summary_path,
+            'csv_file': summary_path if output_format == "csv" else None
         }
         
         # Print summary
@@ -211,6 +701,206 @@ class BindingAnalyzer:
         
         return results
     
+    @staticmethod
+    def _save_summary(residue_df: "pd.DataFrame", output_dir: str, output_format: str) -> str:
+        """
+        Write the residue summary to output_dir in the requested format.
+        
+        CSV goes through pyarrow's writer when it is installed, avoiding pandas'
+        pure-Python CSV writer.
+        
+        Returns:
+            str: Path of the written file
+        """
+        summary_path = os.path.join(output_dir, f'binding_mode_summary.{output_format}')
+        
+        if output_format == "parquet":
+            residue_df.to_parquet(summary_path, engine='pyarrow', compression='zstd', index=False)
+        elif output_format == "feather":
+            residue_df.reset_index(drop=True).to_feather(summary_path)
+        elif find_spec("pyarrow") is not None:
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+            # Written unquoted, header included (pyarrow always quotes its own
+            # header), so the file is byte-for-byte what DataFrame.to_csv() writes
+            table = pa.Table.from_pandas(residue_df, preserve_index=False)
+            try:
+                with open(summary_path, 'wb') as f:
+                    f.write((",".join(table.column_names) + "\n").encode())
+                    pacsv.write_csv(table, f, write_options=pacsv.WriteOptions(
+                        include_header=False, quoting_style="none"))
+            except pa.ArrowInvalid:
+                # Some value needs quoting; leave the escaping to pandas
+                residue_df.to_csv(summary_path, index=False)
+        else:
+            residue_df.to_csv(summary_path, index=False)
+        
+        return summary_path
+    
+    def analyze_lightweight(self,
+                            receptor_file: str,
+                            ligand_file: str,
+                            output_dir: str = "./binana_analysis/",
+                            only: Optional[List[str]] = None,
+                            materialize_outputs: bool = True) -> Dict[str, Set[str]]:
+        """
+        Run BINANA and return just the receptor residues of each interaction type.
+        
+        Skips pandas, the summary file and the full BINANA data, for callers
+        that only need residue lists or counts.
+        
+        Args:
+            receptor_file (str): Path to receptor PDBQT file
+            ligand_file (str): Path to ligand PDBQT file
+            output_dir (str): Output directory for BINANA's own files
+            only (List[str], optional): Interaction types to extract (names from
+                INTERACTION_KEYS). If None, extracts all of them.
+            materialize_outputs (bool): Whether to write BINANA's files to
+                output_dir. If False, nothing is written there.
+            
+        Returns:
+            Dict[str, Set[str]]: Residue labels per interaction type, in
+            INTERACTION_KEYS order (empty sets for types not found)
+        """
+        self.validate_inputs(receptor_file, ligand_file)
+        interactions = self._selected_interactions(only)
+        
+        with self._receptor_atoms_for(receptor_file, ligand_file, output_dir, materialize_outputs,
+                                      False, interactions) as (receptor_atoms, _):
+            return self._build_residue_summary(receptor_atoms, interactions)
+    
+    def analyze_many(self,
+                     jobs: List[Tuple[str, str, str]],
+                     save_csv: bool = True,
+                     keep_full_data: bool = True,
+                     output_format: str = "csv",
+                     max_workers: Optional[int] = None,
+                     materialize_outputs: bool = True) -> List[Dict]:
+        """
+        Run independent analyses in parallel worker processes.
+        
+        Processes are used rather than threads: BINANA is pure Python and keeps
+        module-level state, so in-process runs cannot share one interpreter.
+        
+        Args:
+            jobs (List[Tuple[str, str, str]]): (receptor_file, ligand_file, output_dir)
+                for each analysis
+            save_csv (bool): Whether to save a summary file per analysis
+            keep_full_data (bool): Whether to include the full BINANA data in each
+                result (it must be sent back from the worker process)
+            output_format (str): Summary file format: 'csv', 'parquet' or 'feather'
+            max_workers (int, optional): Number of worker processes. If None,
+                uses all CPU cores.
+            materialize_outputs (bool): Whether to write output files to each
+                job's output_dir (see analyze())
+            
+        Returns:
+            List[Dict]: Results of analyze() for each job, in the same order
+        """
+        for receptor_file, ligand_file, _ in jobs:
+            self.validate_inputs(receptor_file, ligand_file)
+        
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            futures = [
+                executor.submit(self._analyze_counting_cache, receptor_file, ligand_file, output_dir,
+                                save_csv, keep_full_data, output_format,
+                                materialize_outputs=materialize_outputs)
+                for receptor_file, ligand_file, output_dir in jobs
+            ]
+            
+            all_results = []
+            for future in futures:
+                results, cache_hits, cache_misses = future.result()
+                self._cache_hits += cache_hits
+                self._cache_misses += cache_misses
+                all_results.append(results)
+            return all_results
+    
+    def _analyze_counting_cache(self, *args, **kwargs) -> Tuple[Dict, int, int]:
+        """
+        Run analyze() in a worker process, also returning the cache hits and
+        misses it caused, which would otherwise stay in the worker's copy of
+        the analyzer.
+        """
+        cache_hits, cache_misses = self._cache_hits, self._cache_misses
+        results = self.analyze(*args, **kwargs)
+        return results, self._cache_hits - cache_hits, self._cache_misses - cache_misses
+    
+    def analyze_batch(self,
+                      receptor_file: str,
+                      ligand_files: List[str],
+                      output_dir: str = "./binana_analysis/",
+                      save_csv: bool = True,
+                      output_format: str = "csv",
+                      max_workers: Optional[int] = None,
+                      concat: bool = False,
+                      materialize_outputs: bool = True) -> Union[Dict[str, "pd.DataFrame"], "pd.DataFrame"]:
+        """
+        Analyze many ligands against one receptor, running BINANA in parallel.
+        
+        Each ligand gets its own subdirectory of output_dir, named after the
+        ligand file.
+        
+        Args:
+            receptor_file (str): Path to receptor PDBQT file
+            ligand_files (List[str]): Paths to ligand PDBQT files, each listed once
+            output_dir (str): Output directory for results
+            save_csv (bool): Whether to save a summary file per ligand
+            output_format (str): Summary file format: 'csv', 'parquet' or 'feather'
+            max_workers (int, optional): Number of worker processes. If None,
+                uses all CPU cores.
+            concat (bool): Return one DataFrame keyed by ligand path instead
+                of a dict
+            materialize_outputs (bool): Whether to write output files under
+                output_dir. If False, only the returned summaries are produced.
+            
+        Returns:
+            Union[Dict[str, pd.DataFrame], pd.DataFrame]: Residue interaction
+            summary for each ligand
+        """
+        # Results are keyed by ligand path, so a repeated path would lose one
+        duplicates = sorted(ligand_file for ligand_file, count in Counter(ligand_files).items() if count > 1)
+        if duplicates:
+            raise ValueError(f"Duplicate ligand files: {duplicates}")
+        
+        ligand_dirs = self._ligand_output_dirs(ligand_files, output_dir)
+        jobs = [
+            (receptor_file, ligand_file, ligand_dir) 
+            for ligand_file, ligand_dir in zip(ligand_files, ligand_dirs)
+        ]
+        
+        all_results = self.analyze_many(jobs, save_csv, False, output_format, max_workers,
+                                        materialize_outputs)
+        residue_dfs = {
+            ligand_file: results['residue_summary']
+            for ligand_file, results in zip(ligand_files, all_results)
+        }
+        
+        if concat:
+            if not residue_dfs:
+                # pd.concat() refuses an empty list
+                return self._summary_to_df({})
+            import pandas as pd
+            batch_df = pd.concat(list(residue_dfs.values()), keys=list(residue_dfs.keys()))
+            # The ligands' categories differ, so concat() decodes the column back
+            # to strings; re-encode it, as residues repeat most across ligands
+            batch_df["receptor_residue"] = batch_df["receptor_residue"].astype("category")
+            return batch_df
+        return residue_dfs
+    
+    @staticmethod
+    def _ligand_output_dirs(ligand_files: List[str], output_dir: str) -> List[str]:
+        """Pick a distinct output subdirectory for each ligand file."""
+        seen = defaultdict(int)
+        ligand_dirs = []
+        for ligand_file in ligand_files:
+            name = Path(ligand_file).stem
+            seen[name] += 1
+            if seen[name] > 1:
+                name = f"{name}_{seen[name]}"
+            ligand_dirs.append(os.path.join(output_dir, name))
+        return ligand_dirs
+    
     def _print_summary(self, results: Dict) -> None:
         """Print analysis summary to console."""
         print("\n" + "=" * 60)
@@ -224,9 +914,10 @@ class BindingAnalyzer:
         for interaction_type, count in results['interaction_statistics'].items():
             print(f"   • {interaction_type}: {count}")
         
-        print(f"\n📁 Results saved to: {results['output_directory']}")
-        if results['csv_file']:
-            print(f"📊 CSV summary: {results['csv_file']}")
+        if results['output_directory']:
+            print(f"\n📁 Results saved to: {results['output_directory']}")
+        if results['summary_file']:
+            print(f"📊 Summary file: {results['summary_file']}")
         
         print("=" * 60)
 
@@ -241,6 +932,7 @@ Examples:
   %(prog)s -r protein.pdbqt -l ligand.pdbqt
   %(prog)s -r receptor.pdbqt -l molecule.pdbqt -o ./analysis/ --quiet
   %(prog)s -r protein.pdbqt -l ligand.pdbqt --no-csv
+  %(prog)s -r protein.pdbqt -l ligand.pdbqt --format parquet
         """
     )
     
@@ -254,8 +946,14 @@ Examples:
                       help='Run in quiet mode (minimal output)')
     parser.add_argument('--no-csv', action='store_true',
                       help='Do not save CSV summary')
+    parser.add_argument('--format', choices=SUMMARY_FORMATS, default='csv',
+                      help='Summary file format (default: csv)')
     parser.add_argument('--binana-path',
                       help='Custom path to run_binana.py')
+    parser.add_argument('--subprocess', action='store_true',
+                      help='Run BINANA as a separate process instead of in-process')
+    parser.add_argument('--cache-dir',
+                      help='Cache BINANA results here and reuse them for identical inputs')
     
     args = parser.parse_args()
     
@@ -263,7 +961,9 @@ Examples:
         # Initialize analyzer
         analyzer = BindingAnalyzer(
             binana_path=args.binana_path,
-            show_output=not args.quiet
+            show_output=not args.quiet,
+            cache_dir=args.cache_dir,
+            in_process=not args.subprocess
         )
         
         # Run analysis
@@ -271,7 +971,9 @@ Examples:
             receptor_file=args.receptor,
             ligand_file=args.ligand,
             output_dir=args.output,
-            save_csv=not args.no_csv
+            save_csv=not args.no_csv,
+            keep_full_data=False,
+            output_format=args.format
         )
         
         print(f"\n✅ Analysis completed successfully!")
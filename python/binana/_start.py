@@ -27,13 +27,18 @@ from binana._utils.shim import fabs
 VERSION = "2.1"
 
 
-def _get_all_interactions(parameters):
-    """Gets all the interactions between the specified ligand and receptor
-    files.
+def _calculate_all_interactions(parameters):
+    """Loads the specified ligand and receptor files and calculates all the
+    interactions between them, without writing any output.
 
     Args:
         parameters (binana._cli_params.get_params.CommandLineParameters):
             The BINANA parameters to use.
+
+    Returns:
+        list: The ligand and receptor (binana._structure.mol.Mol objects) and
+        a dictionary of all the interactions (the output of
+        :py:func:`~binana.interactions.get_all_interactions`), respectively.
     """
 
     max_cutoff = (
@@ -83,6 +88,20 @@ def _get_all_interactions(parameters):
     for key in all_interacts["cat_pi"]["counts"].keys():
         all_interacts["pi_pi"]["counts"][key] = all_interacts["cat_pi"]["counts"][key]
 
+    return ligand, receptor, all_interacts
+
+
+def _get_all_interactions(parameters):
+    """Gets all the interactions between the specified ligand and receptor
+    files.
+
+    Args:
+        parameters (binana._cli_params.get_params.CommandLineParameters):
+            The BINANA parameters to use.
+    """
+
+    ligand, receptor, all_interacts = _calculate_all_interactions(parameters)
+
     # Now save the files
     _write_main(
         parameters,
@@ -103,6 +122,24 @@ def _get_all_interactions(parameters):
     )
 
 
+def _get_all_interactions_dict(parameters):
+    """Gets all the interactions between the specified ligand and receptor
+    files as a dictionary, without writing any files. The dictionary has the
+    same contents as the JSON output file.
+
+    Args:
+        parameters (binana._cli_params.get_params.CommandLineParameters):
+            The BINANA parameters to use.
+
+    Returns:
+        dict: A dictionary describing all the detected interactions, suitable
+        for conversion to JSON.
+    """
+
+    ligand, receptor, all_interacts = _calculate_all_interactions(parameters)
+    return binana.output.dictionary.collect_all(all_interacts)
+
+
 def _intro():
     print("# BINANA " + VERSION + "\n")
 
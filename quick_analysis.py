@@ -5,14 +5,18 @@ This module provides simple functions for common binding analysis tasks.
 """
 
 from .binding_analyzer import BindingAnalyzer
-import pandas as pd
-from typing import Dict, Optional
+import os
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 def analyze_binding(receptor_file: str, 
                    ligand_file: str, 
                    output_dir: str = "./analysis/",
-                   quiet: bool = False) -> pd.DataFrame:
+                   quiet: bool = False) -> "pd.DataFrame":
     """
     Quick binding mode analysis with minimal setup.
     
@@ -30,7 +34,7 @@ def analyze_binding(receptor_file: str,
         >>> print(results.head())
     """
     analyzer = BindingAnalyzer(show_output=not quiet)
-    results = analyzer.analyze(receptor_file, ligand_file, output_dir)
+    results = analyzer.analyze(receptor_file, ligand_file, output_dir, keep_full_data=False)
     return results['residue_summary']
 
 
@@ -52,14 +56,14 @@ def get_interaction_summary(receptor_file: str,
         >>> stats = get_interaction_summary('protein.pdbqt', 'ligand.pdbqt')
         >>> print(f"Found {stats['total_interactions']} interactions")
     """
-    analyzer = BindingAnalyzer(show_output=not quiet)
-    results = analyzer.analyze(receptor_file, ligand_file, save_csv=False)
+    summary = _interaction_summary(receptor_file, ligand_file, quiet=quiet)
+    interaction_stats, unique_residues = BindingAnalyzer.interaction_statistics(summary)
     
     return {
-        'total_interactions': len(results['residue_summary']),
-        'unique_residues': results['unique_residues_count'],
-        'interaction_breakdown': results['interaction_statistics'],
-        'key_residues': results['residue_summary']['receptor_residue'].unique().tolist()
+        'total_interactions': sum(map(len, summary.values())),
+        'unique_residues': unique_residues,
+        'interaction_breakdown': interaction_stats,
+        'key_residues': _ordered_residues(summary)
     }
 
 
@@ -83,12 +87,58 @@ def find_key_residues(receptor_file: str,
         >>> hydrophobic_residues = find_key_residues('protein.pdbqt', 'ligand.pdbqt', 
         ...                                        'hydrophobic_contacts')
     """
-    analyzer = BindingAnalyzer(show_output=not quiet)
-    results = analyzer.analyze(receptor_file, ligand_file, save_csv=False)
+    if interaction_type:
+        # Raises ValueError for unknown types before BINANA runs
+        BindingAnalyzer._selected_interactions([interaction_type])
     
-    df = results['residue_summary']
+    summary = _interaction_summary(receptor_file, ligand_file, quiet)
     
     if interaction_type:
-        df = df[df['interaction_type'] == interaction_type]
-    
-    return df['receptor_residue'].unique().tolist()
\ No newline at end of file
+        return sorted(summary[interaction_type])
+    return _ordered_residues(summary)
+
+
+def _interaction_summary(receptor_file: str, 
+                         ligand_file: str, 
+                         quiet: bool = True) -> Dict[str, FrozenSet[str]]:
+    """
+    Residues of every interaction type, memoized on the input paths and
+    modification times so that repeated helper calls on the same pair run
+    BINANA only once, whichever views of it they ask for.
+    """
+    return _cached_interaction_summary(
+        os.path.abspath(receptor_file), os.path.abspath(ligand_file),
+        _mtime(receptor_file), _mtime(ligand_file), quiet
+    )
+
+
+@lru_cache(maxsize=128)
+def _cached_interaction_summary(receptor_file: str, 
+                                ligand_file: str, 
+                                receptor_mtime: Optional[int], 
+                                ligand_mtime: Optional[int],
+                                quiet: bool) -> Dict[str, FrozenSet[str]]:
+    """Cached body of _interaction_summary(); the mtimes only serve as cache keys."""
+    analyzer = BindingAnalyzer(show_output=not quiet)
+    # BINANA computes every interaction type anyway, so the full summary is
+    # cached. Nothing is read back from disk, so BINANA's files are never written.
+    summary = analyzer.analyze_lightweight(receptor_file, ligand_file, materialize_outputs=False)
+    # Frozen, since the same object is handed to every later caller
+    return {interaction_type: frozenset(residues) for interaction_type, residues in summary.items()}
+
+
+def _mtime(path: str) -> Optional[int]:
+    """Modification time of path, or None if it does not exist (left for validation to report)."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _ordered_residues(summary: Dict[str, FrozenSet[str]]) -> List[str]:
+    """Unique residues in summary order (by interaction type, then sorted)."""
+    residues = {}
+    for type_residues in summary.values():
+        for residue in sorted(type_residues):
+            residues.setdefault(residue)
+    return list(residues)
\ No newline at end of file